@@ -4,11 +4,306 @@
 # @Last Modified by:   John Portella
 # @Last Modified time: 2023-01-22 14:21:42
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 import os
+import threading
+import time
+import weakref
 from datetime import datetime
 
+# Daily log name, computed once per process
+_TODAY_LOG = '{:%Y-%m-%d}.log'.format(datetime.now())
+# File log rotation defaults
+_MAX_BYTES = 64 * 1024 * 1024
+_BACKUP_COUNT = 5
+
+# Log directories already created by this process
+_CREATED_DIRS = set()
+
+# Formatters shared by every logger
+_STREAM_FMT = logging.Formatter("%(asctime)s:%(name)s:%(levelname)s:%(message)s")
+_FILE_FMT = logging.Formatter('%(asctime)s | %(name)s | %(levelname)-8s | %(lineno)04d | %(message)s')
+
+# Stream handler shared by every logger
+_STDOUT_HANDLER = logging.StreamHandler(sys.stdout)
+_STDOUT_HANDLER.setLevel(logging.DEBUG)
+_STDOUT_HANDLER.setFormatter(_STREAM_FMT)
+
+def _generate_log_dir(log_dir):
+    """
+    Creates log directory if it does not exist, skipping directories already created by this process
+    :param log_dir: directory to save log files
+    :type log_dir: str
+    """
+    if log_dir in _CREATED_DIRS:
+        return
+    os.makedirs(log_dir, exist_ok=True)
+    _CREATED_DIRS.add(log_dir)
+
+# Queue shared by every logger, emptied by a single listener thread
+_LOG_QUEUE = queue.Queue()
+_LISTENER = None
+_LISTENER_LOCK = threading.Lock()
+
+class _Dispatcher:
+    """
+    Emits each queued record to the handlers of the queue handler that queued it
+    """
+    def handle(self, record):
+        """
+        :param record: record to emit
+        :type record: logging.LogRecord
+        """
+        for handler in record.targets:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+def _start_listener():
+    """
+    Starts the shared listener thread if it is not running
+    """
+    global _LISTENER
+    with _LISTENER_LOCK:
+        if _LISTENER is None:
+            _LISTENER = logging.handlers.QueueListener(_LOG_QUEUE, _Dispatcher())
+            _LISTENER.start()
+
+def _stop_listener():
+    """
+    Stops the shared listener thread once every queued record has been handled
+    """
+    global _LISTENER
+    with _LISTENER_LOCK:
+        if _LISTENER is not None:
+            _LISTENER.stop()
+            _LISTENER = None
+
+# Drain the queue before logging closes the handlers
+atexit.register(_stop_listener)
+
+class _Marker:
+    """
+    Target of the record queued by wait_handled, set once the listener reaches it
+    """
+    level = logging.NOTSET
+
+    def __init__(self):
+        self.handled = threading.Event()
+
+    def handle(self, record):
+        """
+        :param record: the marker record
+        :type record: logging.LogRecord
+        """
+        self.handled.set()
+
+class _RoutingQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler feeding the shared listener, the calling thread never waits on stream or file I/O.
+    Queued records carry the handlers that must emit them.
+    """
+    def __init__(self, *targets):
+        """
+        :param targets: handlers that will emit the queued records
+        :type targets: logging.Handler
+        """
+        super().__init__(_LOG_QUEUE)
+        self.targets = targets
+        _start_listener()
+
+    def prepare(self, record):
+        """
+        :param record: record to queue
+        :type record: logging.LogRecord
+        :return: a copy of the record tagged with the current targets
+        :rtype: logging.LogRecord
+        """
+        record = super().prepare(record)
+        record.targets = self.targets
+        return record
+
+    def wait_handled(self):
+        """
+        Waits until the records queued so far by this handler have been handled, records queued
+        by other loggers in the meantime are not waited for
+        """
+        marker = _Marker()
+        record = logging.LogRecord('', logging.NOTSET, '', 0, '', (), None)
+        record.targets = (marker,)
+        with _LISTENER_LOCK:
+            if _LISTENER is None:
+                return
+            # the queue is FIFO, the listener reaches the marker after every earlier record
+            self.enqueue(record)
+        marker.handled.wait()
+
+# Buffered file handlers, flushed by a single background thread
+_BUFFERED_HANDLERS = weakref.WeakSet()
+_FLUSHER = None
+_FLUSHER_LOCK = threading.Lock()
+
+def _flush_periodically():
+    """
+    Flushes every buffered file handler once its flush interval has elapsed, checking every second
+    """
+    while True:
+        time.sleep(1)
+        now = time.monotonic()
+        with _FLUSHER_LOCK:
+            handlers = list(_BUFFERED_HANDLERS)
+        for handler in handlers:
+            if now >= handler.next_flush:
+                handler.next_flush = now + handler.flush_interval
+                handler.flush()
+
+def _register_buffered(handler):
+    """
+    Adds the handler to the periodic flush, starting the flush thread if it is not running
+    :param handler: handler to flush periodically
+    :type handler: BufferedFileHandler
+    """
+    global _FLUSHER
+    with _FLUSHER_LOCK:
+        _BUFFERED_HANDLERS.add(handler)
+        if _FLUSHER is None:
+            _FLUSHER = threading.Thread(target=_flush_periodically, daemon=True)
+            _FLUSHER.start()
+
+class BufferedFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    BufferedFileHandler is a rotating file handler that writes through a large user-space buffer
+    instead of flushing the file after every record. It has the following features:
+    - Opens the log file with a buffer of the given size (default: 128 KB)
+    - Flushes the buffer periodically from a background thread shared by every handler
+    - Records at or above the flush level are flushed immediately
+    - Rotates the log file once it reaches max_bytes, keeping backup_count old files
+    """
+    def __init__(self, filename, mode='a', max_bytes=0, backup_count=0, encoding=None, delay=False,
+                 buffer_size=131072, flush_interval=30, flush_level=logging.ERROR):
+        """
+        :param filename: path of the log file
+        :type filename: str
+        :param mode: mode used to open the log file (default: 'a')
+        :type mode: str
+        :param max_bytes: size in bytes at which the log file is rotated, 0 never rotates (default: 0)
+            Rotation also needs a backup_count above 0, without backups the file is never rotated
+        :type max_bytes: int
+        :param backup_count: number of rotated log files to keep (default: 0)
+        :type backup_count: int
+        :param encoding: encoding of the log file (default: None)
+        :type encoding: str
+        :param delay: defer opening the file until the first record (default: False)
+        :type delay: bool
+        :param buffer_size: size in bytes of the file buffer (default: 131072)
+        :type buffer_size: int
+        :param flush_interval: seconds between periodic flushes (default: 30)
+        :type flush_interval: float
+        :param flush_level: records at or above this level are flushed immediately (default: ERROR)
+        :type flush_level: int
+        """
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.flush_level = flush_level
+        super().__init__(filename, mode, max_bytes, backup_count, encoding, delay)
+
+        # Periodic flush
+        self.next_flush = time.monotonic() + flush_interval
+        _register_buffered(self)
+
+    def _open(self):
+        """
+        :return: the log file opened with the configured buffer size
+        :rtype: io.TextIOWrapper
+        """
+        stream = open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                      encoding=self.encoding, errors=self.errors)
+        # Size is tracked on write, TextIOWrapper.tell() would flush the buffer
+        self._size = stream.tell()
+        return stream
+
+    def emit(self, record):
+        """
+        Writes the record to the buffer, only records at or above the flush level are flushed
+        :param record: record to write
+        :type record: logging.LogRecord
+        """
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            msg = self.format(record) + self.terminator
+            size = len(msg.encode(self.stream.encoding, self.stream.errors))
+            # rotate before the file grows past maxBytes
+            if self.maxBytes > 0 and self.backupCount > 0 and self._size and self._size + size >= self.maxBytes:
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            self.stream.write(msg)
+            self._size += size
+            if record.levelno >= self.flush_level:
+                self.stream.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def close(self):
+        """
+        Stops the periodic flush and closes the log file
+        """
+        with _FLUSHER_LOCK:
+            _BUFFERED_HANDLERS.discard(self)
+        super().close()
+
+# File handlers shared by every logger, keyed by log file, and their number of users
+_FILE_HANDLERS = {}
+_FILE_HANDLER_USERS = {}
+_FILE_HANDLERS_LOCK = threading.Lock()
+
+def _shared_file_handler(log_file, max_bytes, backup_count):
+    """
+    Returns the file handler writing to the log file, creating it on first use. Loggers writing
+    to the same file share one handler, several rotating handlers on one file lose records
+    :param log_file: path of the log file
+    :type log_file: str
+    :param max_bytes: size in bytes at which the log file is rotated, only used on creation
+    :type max_bytes: int
+    :param backup_count: number of rotated log files to keep, only used on creation
+    :type backup_count: int
+    :return: the file handler of the log file
+    :rtype: BufferedFileHandler
+    """
+    log_file = os.path.abspath(log_file)
+    with _FILE_HANDLERS_LOCK:
+        if log_file not in _FILE_HANDLERS:
+            # The file is only opened once the first record is written
+            file_handler = BufferedFileHandler(log_file, max_bytes=max_bytes, backup_count=backup_count,
+                                               encoding='utf-8', delay=True)
+            file_handler.setLevel(logging.DEBUG)
+            file_handler.setFormatter(_FILE_FMT)
+            _FILE_HANDLERS[log_file] = file_handler
+            _FILE_HANDLER_USERS[log_file] = 0
+        _FILE_HANDLER_USERS[log_file] += 1
+        return _FILE_HANDLERS[log_file]
+
+def _release_file_handler(file_handler):
+    """
+    Releases a file handler returned by _shared_file_handler, closing it once its last user released it
+    :param file_handler: the file handler to release
+    :type file_handler: BufferedFileHandler
+    """
+    log_file = file_handler.baseFilename
+    with _FILE_HANDLERS_LOCK:
+        _FILE_HANDLER_USERS[log_file] -= 1
+        if _FILE_HANDLER_USERS[log_file]:
+            return
+        del _FILE_HANDLERS[log_file]
+        del _FILE_HANDLER_USERS[log_file]
+    file_handler.close()
+
 class LoggerFactory(logging.getLoggerClass()): 
     """
     LoggerFactory is a class that inherits from the logging module's logger class and 
@@ -18,31 +313,38 @@ class LoggerFactory(logging.getLoggerClass()):
     - Provides methods for enabling/disabling console and file output
     - Automatically creates a log directory if it does not exist
     - File logs are saved with the date appended to the filename
+    - Records are written to the console and file from a background thread
     """
-    def __init__(self, name, log_dir=None):
+    def __init__(self, name, log_dir=None, max_bytes=_MAX_BYTES, backup_count=_BACKUP_COUNT):
         """
         :param name: name of the logger
         :type name: str
         :param log_dir: directory to save log files (default: None)
         :type log_dir: str
+        :param max_bytes: size in bytes at which the log file is rotated, the first logger of a log file sets it (default: 64 MB)
+        :type max_bytes: int
+        :param backup_count: number of rotated log files to keep, the first logger of a log file sets it (default: 5)
+        :type backup_count: int
         """        
         # initialize logger
         super().__init__(name)
         self.setLevel(logging.DEBUG)
         
-        # log formatter
-        log_format = "%(asctime)s:%(name)s:%(levelname)s:%(message)s"
+        # Stream handler
+        self.stdout_handler = _STDOUT_HANDLER
 
-        # Create stream handler
-        self.stdout_handler = logging.StreamHandler(sys.stdout)
-        self.stdout_handler.setLevel(logging.DEBUG)
-        self.stdout_handler.setFormatter(logging.Formatter(log_format))        
+        # Records are queued and handled by the shared listener thread
+        self.queue_handler = _RoutingQueueHandler()
+        self._console_enabled = False
+        self._file_enabled = False
+        self._closed = False
+        self.addHandler(self.queue_handler)
         self.enable_console_output()
 
         # Create file handler
         self.file_handler = None
         if log_dir:
-            self.add_file_handler(name, log_dir)
+            self.add_file_handler(name, log_dir, max_bytes, backup_count)
 
     def generate_log_dir(self, log_dir):
         """
@@ -50,145 +352,211 @@ class LoggerFactory(logging.getLoggerClass()):
         :param log_dir: directory to save log files
         :type log_dir: str
         """
-        if not os.path.exists(log_dir):
-            os.makedirs(log_dir)
+        _generate_log_dir(log_dir)
 
     def has_console_handler(self):
         """
         :return: True if the logger has a stream handler, False otherwise
         :rtype: bool
         """
-        return len([h for h in self.handlers if type(h) == logging.StreamHandler]) > 0
+        return self._console_enabled
     
     def has_file_handler(self):
         """
         :return: True if the logger has a file handler, False otherwise
         :rtype: bool
         """
-        return len([h for h in self.handlers if isinstance(h, logging.FileHandler)]) > 0
+        return self._file_enabled
+
+    def _set_targets(self, *handlers):
+        """
+        Replaces the handlers that emit the records of this logger, records already queued keep
+        the handlers they were tagged with so toggling an output never affects them
+        :param handlers: handlers that will emit the queued records
+        :type handlers: logging.Handler
+        """
+        self.queue_handler.targets = handlers
+
+    def _update_disabled(self):
+        """
+        Skips records entirely when no output is enabled and no other handler was added to the logger
+        """
+        self.disabled = not (self._console_enabled or self._file_enabled
+                             or any(h is not self.queue_handler for h in self.handlers))
+
+    def addHandler(self, hdlr):
+        """
+        Adds the specified handler to the logger
+        :param hdlr: handler to add
+        :type hdlr: logging.Handler
+        """
+        super().addHandler(hdlr)
+        self._update_disabled()
+
+    def removeHandler(self, hdlr):
+        """
+        Removes the specified handler from the logger
+        :param hdlr: handler to remove
+        :type hdlr: logging.Handler
+        """
+        super().removeHandler(hdlr)
+        self._update_disabled()
 
     def enable_console_output(self):
         """
         Enables console output for the logger
         """
-        if self.has_console_handler():
+        if self._closed or self._console_enabled:
             return
-        self.addHandler(self.stdout_handler)
+        self._set_targets(*self.queue_handler.targets, self.stdout_handler)
+        self._console_enabled = True
+        self._update_disabled()
     
     def disable_console_output(self):
         """
         Disables console output for the logger
         """
-        if not self.has_console_handler():
+        if not self._console_enabled:
             return
-        self.removeHandler(self.stdout_handler)
+        self._set_targets(*[h for h in self.queue_handler.targets if h is not self.stdout_handler])
+        self._console_enabled = False
+        self._update_disabled()
         
     def enable_file_output(self):
         """
         Enables file output for the logger
         """
-        if self.has_file_handler():
+        if self._closed or self._file_enabled or self.file_handler is None:
             return
-        self.addHandler(self.file_handler)
+        self._set_targets(*self.queue_handler.targets, self.file_handler)
+        self._file_enabled = True
+        self._update_disabled()
     
     def disable_file_output(self):
         """
         Disables file output for the logger
         """
-        if not self.has_file_handler():
+        if not self._file_enabled:
             return
-        self.removeHandler(self.file_handler)
+        self._set_targets(*[h for h in self.queue_handler.targets if h is not self.file_handler])
+        self._file_enabled = False
+        self._update_disabled()
+        # write out buffered records before detaching
+        self.queue_handler.wait_handled()
+        self.file_handler.flush()
     
-    def add_file_handler(self, name, log_dir):
+    def add_file_handler(self, name, log_dir, max_bytes=_MAX_BYTES, backup_count=_BACKUP_COUNT):
         """
         Adds a file handler to the logger
         :param name: name of the logger
         :type name: str
         :param log_dir: directory to save log files
         :type log_dir: str
+        :param max_bytes: size in bytes at which the log file is rotated, the first logger of a log file sets it (default: 64 MB)
+        :type max_bytes: int
+        :param backup_count: number of rotated log files to keep, the first logger of a log file sets it (default: 5)
+        :type backup_count: int
         """
-        # Format for file log
-        log_format = '%(asctime)s | %(name)s | %(levelname)-8s | %(lineno)04d | %(message)s'
-        formatter = logging.Formatter(log_format)
-        log_name = f"{name}.log" if name else '{:%Y-%m-%d}.log'.format(datetime.now())
+        if self._closed:
+            return
+        # Replace the current file handler, if any
+        if self.file_handler is not None:
+            self.disable_file_output()
+            # records queued while file output was on must be written before releasing
+            self.queue_handler.wait_handled()
+            _release_file_handler(self.file_handler)
+        log_name = f"{name}.log" if name else _TODAY_LOG
         log_file = os.path.join(log_dir, log_name)
         # Create log dir
         self.generate_log_dir(log_dir)
-        # Create file handler for logging to a file
-        self.file_handler = logging.FileHandler(log_file)
-        self.file_handler.setLevel(logging.DEBUG)
-        self.file_handler.setFormatter(formatter)
-        self.addHandler(self.file_handler)
+        # File handler shared with the other loggers of the log file
+        self.file_handler = _shared_file_handler(log_file, max_bytes, backup_count)
+        self.enable_file_output()
+
+    def close(self):
+        """
+        Detaches the logger from the shared listener once its queued records have been handled
+        and releases the file handler, the log file is closed once no other logger writes to it.
+        Records logged afterwards are dropped and the outputs can't be enabled again.
+        Handlers still open at exit are flushed and closed by logging itself
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._console_enabled = False
+        self._file_enabled = False
+        self.queue_handler.targets = ()
+        self.removeHandler(self.queue_handler)
+        self.queue_handler.wait_handled()
+        if self.file_handler is not None:
+            _release_file_handler(self.file_handler)
+            self.file_handler = None
 
 class StaticLoggerFactory:
     """
-    This class is a factory for creating a singleton instance of a logger. The logger is initialized with the given name and can write log messages to both stdout and a file in the specified log directory.
+    This class is a factory for creating a singleton instance of a logger per name. The logger is initialized with the given name and can write log messages to both stdout and a file in the specified log directory.
 
     Attributes:
-        _LOG (logging.Logger): a singleton instance of a logger
+        _LOGS (dict): the singleton instance of a logger for each name
 
     Methods:
-        __new__(cls, name, log_dir=None): creates and returns a singleton instance of a logger. The logger is initialized with the given name and can write log messages to both stdout and a file in the specified log directory.
+        __new__(cls, name, log_dir=None, max_bytes=_MAX_BYTES, backup_count=_BACKUP_COUNT): creates and returns the singleton instance of a logger for the given name. The logger is initialized with the given name and can write log messages to both stdout and a file in the specified log directory.
     """    
-    _LOG = None
+    _LOGS = {}
 
-    def __new__(cls, name, log_dir=None):
+    def __new__(cls, name, log_dir=None, max_bytes=_MAX_BYTES, backup_count=_BACKUP_COUNT):
         """
-        Creates and returns a singleton instance of a logger. The logger is initialized with the given name and can write log messages to both stdout and a file in the specified log directory.
+        Creates and returns the singleton instance of a logger for the given name. The logger is initialized with the given name and can write log messages to both stdout and a file in the specified log directory.
         
         Arguments:
             name (str): the name of the logger
             log_dir (str): the directory where log files will be written, if None, only stdout is used
+            max_bytes (int): the size in bytes at which the log file is rotated, the first logger of a log file sets it
+            backup_count (int): the number of rotated log files to keep, the first logger of a log file sets it
         
         Returns:
             logging.Logger: the singleton instance of the logger
         """        
-        if cls._LOG is None:
-            # initialize singleton instance
-            cls._LOG = super().__new__(cls)
-
-            # initialize logger            
-            cls._LOG = logging.getLogger(name)
-            cls._LOG.setLevel(logging.DEBUG)
-
-            # log formatter
-            log_format = "%(asctime)s:%(name)s:%(levelname)s:%(message)s"
-
-            #Create stream handler
-            stdout_handler = logging.StreamHandler(sys.stdout)
-            stdout_handler.setLevel(logging.DEBUG)
-            stdout_handler.setFormatter(logging.Formatter(log_format))                
-            cls._LOG.addHandler(stdout_handler)
-
-            if log_dir:                
-                
-                #log formatter   
-                log_format = '%(asctime)s | %(name)s | %(levelname)-8s | %(lineno)04d | %(message)s'
-                
-                #Logname
-                log_name = '{:%Y-%m-%d}.log'.format(datetime.now())
-                formatter = logging.Formatter(log_format)
-                
-                #Create log dir
-                if not os.path.exists(log_dir):
-                    os.makedirs(log_dir)
-                log_file = os.path.join(log_dir, log_name)
-
-                #create file handler
-                file_handler = logging.FileHandler(log_file)
-                file_handler.setLevel(logging.DEBUG)
-                file_handler.setFormatter(formatter)
-                cls._LOG.addHandler(file_handler)
-                            
-        return cls._LOG
-
-def set_logger(name, log_dir=None):
+        if name in cls._LOGS:
+            return cls._LOGS[name]
+
+        # initialize logger            
+        logger = logging.getLogger(name)
+        logger.setLevel(logging.DEBUG)
+        cls._LOGS[name] = logger
+        # already initialized, avoid duplicate handlers
+        if logger.handlers:
+            return logger
+
+        #Stream handler
+        handlers = [_STDOUT_HANDLER]
+
+        if log_dir:                
+            
+            #Logname
+            log_name = _TODAY_LOG
+            
+            #Create log dir
+            _generate_log_dir(log_dir)
+            log_file = os.path.join(log_dir, log_name)
+
+            #file handler shared with the other loggers of the log file
+            handlers.append(_shared_file_handler(log_file, max_bytes, backup_count))
+
+        # Records are queued and handled by the shared listener thread
+        logger.addHandler(_RoutingQueueHandler(*handlers))
+                        
+        return logger
+
+def set_logger(name, log_dir=None, max_bytes=_MAX_BYTES, backup_count=_BACKUP_COUNT):
     """
     Initializes a logger with the given name and can write log messages to both stdout and a file in the specified log directory.
     
     Args:
         name (str): the name of the logger
         log_dir (str): the directory where log files will be written, if None, only stdout is used
+        max_bytes (int): the size in bytes at which the log file is rotated, the first logger of a log file sets it
+        backup_count (int): the number of rotated log files to keep, the first logger of a log file sets it
     
     Returns:
         logging.Logger: the initialized logger
@@ -197,37 +565,38 @@ def set_logger(name, log_dir=None):
     # initialize logging
     logger = logging.getLogger(name)
     logger.setLevel(logging.DEBUG)
+    # already initialized, avoid duplicate handlers
+    if logger.handlers:
+        return logger
     
-    # log formatter
-    log_format = "%(asctime)s:%(name)s:%(levelname)s:%(message)s"
-
-    #Create stream handler
-    stdout_handler = logging.StreamHandler(sys.stdout)
-    stdout_handler.setLevel(logging.DEBUG)
-    stdout_handler.setFormatter(logging.Formatter(log_format))                
-    logger.addHandler(stdout_handler)
+    #Stream handler
+    handlers = [_STDOUT_HANDLER]
 
     if log_dir:
-        #log formatter   
-        log_format = '%(asctime)s | %(name)s | %(levelname)-8s | %(lineno)04d | %(message)s'
-        
         #Logname
-        log_name = '{:%Y-%m-%d}.log'.format(datetime.now())
-        formatter = logging.Formatter(log_format)
+        log_name = _TODAY_LOG
         
         #Create log dir
-        if not os.path.exists(log_dir):
-            os.makedirs(log_dir)
+        _generate_log_dir(log_dir)
         log_file = os.path.join(log_dir, log_name)
 
-        #create file handler
-        file_handler = logging.FileHandler(log_file)
-        file_handler.setLevel(logging.DEBUG)
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        #file handler shared with the other loggers of the log file
+        handlers.append(_shared_file_handler(log_file, max_bytes, backup_count))
+
+    # Records are queued and handled by the shared listener thread
+    logger.addHandler(_RoutingQueueHandler(*handlers))
     
     return logger
 
+def disable_record_metadata():
+    """
+    Stops collecting thread and process information for every log record, the formatters of this module never use it.
+    This applies to every logger of the process, only call it when no other handler needs that information.
+    """
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
 if __name__ == '__main__':
     quiet_log = LoggerFactory('custom class', log_dir='logs')
     quiet_log.warning('Test Warning')
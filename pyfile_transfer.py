@@ -3,15 +3,24 @@
 # @Date:   2023-01-22 11:07:33
 # @Last Modified by:   John Portella
 # @Last Modified time: 2023-01-22 15:46:51
-import paramiko, os
-from ftplib import FTP
+import paramiko, os, atexit, hashlib, hmac, threading
+from concurrent.futures import ThreadPoolExecutor
+from ftplib import FTP, all_errors
+
+#default local directory
+_MODULE_DIR = os.path.dirname(os.path.realpath(__file__))
 
 class PyFileTransfer(object):
     """
     A class for performing file transfer using FTP or SFTP.    
     """
 
-    def __init__(self, typeProtocol='ftp', hostname = 'localhost', so='unix', port = None, timeout = None):
+    #authenticated connections shared by fromPool, keyed by (protocol, host, port, username)
+    _POOL = {}
+    _POOL_LOCK = threading.Lock()
+
+    def __init__(self, typeProtocol='ftp', hostname = 'localhost', so='unix', port = None, timeout = None,
+                 windowSize = 2**27, packetSize = 2**19, compress = True):
         """
         Initializes the PyFileTransfer object and sets the connection parameters.
         Args:
@@ -20,6 +29,9 @@ class PyFileTransfer(object):
             so (str): 'unix' or 'win' depending on the operating system of the server
             port (int): the port number to use for the connection, if None it will use default port for the protocol
             timeout (int): the timeout for the connection, if None it will use default timeout
+            windowSize (int): the SSH channel window size in bytes, only used with SFTP
+            packetSize (int): the maximum SSH packet size in bytes, only used with SFTP
+            compress (bool): whether to enable SSH compression, only used with SFTP
         """
 
         #Protocol
@@ -27,12 +39,13 @@ class PyFileTransfer(object):
         #host
         self.__hostname = hostname
         #so        
-        if so == 'unix':
-            self.__SEP = '/'
-        elif so == 'win':
-            self.__SEP = chr(92)   
+        self.__SEP = {'unix': '/', 'win': chr(92)}[so]
         #timeout
         self.__timeout = timeout
+        #pooled connections are only closed by closePool
+        self.__pooled = False
+        #digest of the password a pooled connection logged in with
+        self.__credential = None
         #port
         if port:
             self.__port = port
@@ -48,6 +61,12 @@ class PyFileTransfer(object):
                 self.__port = 22
             #open
             self.__ssh = paramiko.Transport((self.__hostname, self.__port))
+            #larger window and packets avoid flow-control stalls on high latency links
+            self.__ssh.default_window_size = windowSize
+            self.__ssh.default_max_packet_size = packetSize
+            self.__ssh.use_compression(compress)
+            #sftp client, opened once authenticated
+            self.__t = None
                                                                 
     def connection(self, username, password):
         """
@@ -83,21 +102,87 @@ class PyFileTransfer(object):
         :return: None
         """        
         if localDirectory is None:
-            localDirectory = os.path.dirname(os.path.realpath(__file__))
+            localDirectory = _MODULE_DIR
         
         if self.__typeProtocol == 'ftp':
             pwdAux = self.__t.pwd()            
             if remoteDirectory is not None: 
                 self.__t.cwd(remoteDirectory)
-            remoteFile = open(os.path.join(localDirectory, filename), 'wb').write
-            self.__t.retrbinary("RETR " + filename, remoteFile)            
+            with open(os.path.join(localDirectory, filename), 'wb', buffering=1 << 20) as localFile:
+                self.__t.retrbinary("RETR " + filename, localFile.write, blocksize=1 << 20)
             self.__t.cwd(pwdAux)    
-            remoteFile.close()
         elif self.__typeProtocol == 'sftp':              
             if remoteDirectory is not None:
                 self.__t.chdir(remoteDirectory)                
-            self.__t.get(filename, os.path.join(localDirectory, filename))
+            self.__getFile(self.__t, filename, localDirectory)
             self.__t.chdir(None)            
+
+    def getMany(self, filenames, remoteDirectory=None, localDirectory=None, maxWorkers=8):
+        """
+        This method is used to retrieve several files from a remote directory and save them to a local directory.
+        With SFTP the files are downloaded concurrently, each worker on its own channel of the same session,
+        with FTP they are downloaded one by one.
+        :param filenames: The names of the files to be retrieved.
+        :type filenames: list
+        :param remoteDirectory: The remote directory where the files are located. (default: None)
+        :type remoteDirectory: str
+        :param localDirectory: The local directory where the files will be saved. (default: None)
+        :type localDirectory: str
+        :param maxWorkers: The maximum number of concurrent downloads. (default: 8)
+            Each worker opens its own session channel, values above the server's MaxSessions (10 by default
+            on OpenSSH, the connection already uses one) fail when the channel is opened.
+        :type maxWorkers: int
+        :return: None
+        """
+        if maxWorkers < 1:
+            raise ValueError('maxWorkers must be at least 1')
+        if self.__typeProtocol == 'ftp':
+            #a single control connection can only transfer one file at a time
+            for filename in filenames:
+                self.get(filename, remoteDirectory, localDirectory)
+        elif self.__typeProtocol == 'sftp':
+            if localDirectory is None:
+                localDirectory = _MODULE_DIR
+            filenames = list(filenames)
+            workers = min(maxWorkers, len(filenames))
+            if not workers:
+                return
+            #an SFTPClient can't be shared between threads, split the files between workers
+            batches = [filenames[i::workers] for i in range(workers)]
+            with ThreadPoolExecutor(workers) as executor:
+                list(executor.map(lambda batch: self.__getBatch(batch, remoteDirectory, localDirectory), batches))
+
+    def __getBatch(self, filenames, remoteDirectory, localDirectory):
+        """
+        Downloads files over a new SFTP channel of the authenticated session, closed once they are retrieved.
+        :param filenames: The names of the files to be retrieved.
+        :type filenames: list
+        :param remoteDirectory: The remote directory where the files are located.
+        :type remoteDirectory: str
+        :param localDirectory: The local directory where the files will be saved.
+        :type localDirectory: str
+        """
+        sftp = paramiko.SFTPClient.from_transport(self.__ssh)
+        try:
+            sftp.sock.settimeout(self.__timeout)
+            if remoteDirectory is not None:
+                sftp.chdir(remoteDirectory)
+            for filename in filenames:
+                self.__getFile(sftp, filename, localDirectory)
+        finally:
+            sftp.close()
+
+    def __getFile(self, sftp, filename, localDirectory):
+        """
+        Downloads a file from the current directory of the SFTP client, paramiko prefetches the reads.
+        :param sftp: The SFTP client to download with.
+        :type sftp: paramiko.SFTPClient
+        :param filename: The name of the file to be retrieved.
+        :type filename: str
+        :param localDirectory: The local directory where the file will be saved.
+        :type localDirectory: str
+        """
+        sftp.get(filename, os.path.join(localDirectory, filename))
             
     def put(self, filename, remoteDirectory=None, localDirectory=None):
         """
@@ -111,26 +196,114 @@ class PyFileTransfer(object):
         :type localDirectory: str
         """
         if localDirectory is None:
-            localDirectory = os.path.dirname(os.path.realpath(__file__))
+            localDirectory = _MODULE_DIR
                     
         if self.__typeProtocol == 'ftp':
             pwdAux = self.__t.pwd()
             if remoteDirectory is not None:
                 self.__t.cwd(remoteDirectory)                
-            localFile = open(filename, 'r')
-            self.__t.storbinary('RETR %s' % filename, localFile.write)
+            with open(os.path.join(localDirectory, filename), 'rb', buffering=1 << 20) as localFile:
+                self.__t.storbinary('STOR %s' % filename, localFile, blocksize=1 << 20)
             self.__t.cwd(pwdAux)
-            localFile.close()
         elif self.__typeProtocol == 'sftp':            
             if remoteDirectory is not None:
                 self.__t.chdir(remoteDirectory)
-            self.__t.put(os.path.join(localDirectory, filename), filename)        
+            #paramiko pipelines the writes and checks the uploaded size
+            self.__t.put(os.path.join(localDirectory, filename), filename)
             self.__t.chdir(None)
             
+    @classmethod
+    def fromPool(cls, typeProtocol, hostname, username, password, so='unix', port=None, timeout=None):
+        """
+        Returns an authenticated connection to the server, reusing the pooled one when it is still alive
+        and was opened with the same password, so the login (and the SSH key exchange for SFTP) only
+        happens once per server and user. A different password logs in again and replaces the pooled
+        connection once the login succeeds.
+        :param typeProtocol: 'ftp' or 'sftp' protocol to use for the file transfer
+        :type typeProtocol: str
+        :param hostname: the hostname or IP address of the server
+        :type hostname: str
+        :param username: The username to use for connecting to the remote server.
+        :type username: str
+        :param password: The password to use for connecting to the remote server.
+        :type password: str
+        :param so: 'unix' or 'win' depending on the operating system of the server (default: 'unix')
+        :type so: str
+        :param port: the port number to use for the connection, if None it will use default port for the protocol
+        :type port: int
+        :param timeout: the timeout for the connection, if None it will use default timeout
+        :type timeout: int
+        :return: the pooled connection, in its default directory
+        :rtype: PyFileTransfer
+        """
+        key = (typeProtocol, hostname, port or {'ftp': 21, 'sftp': 22}[typeProtocol], username)
+        credential = hashlib.sha256(password.encode('utf-8')).digest()
+        #one caller at a time, concurrent callers would otherwise each open a connection and leak one
+        with cls._POOL_LOCK:
+            t = cls._POOL.get(key)
+            #the pooled session is only handed to callers that know its password
+            if t is not None and hmac.compare_digest(t.__credential, credential) and t.__isActive():
+                t.setDefaultDirectory()
+                return t
+            newT = cls(typeProtocol, hostname, so, port, timeout)
+            try:
+                newT.connection(username, password)
+            except Exception:
+                #don't leave the failed login's socket open
+                newT.__close()
+                raise
+            #replace the pooled connection only once the new login succeeded
+            if t is not None:
+                t.__close()
+            newT.__pooled = True
+            newT.__credential = credential
+            cls._POOL[key] = newT
+            return newT
+
+    @classmethod
+    def closePool(cls):
+        """
+        Closes every pooled connection. Called automatically at exit.
+        """
+        with cls._POOL_LOCK:
+            while cls._POOL:
+                _, t = cls._POOL.popitem()
+                t.__close()
+
+    def __isActive(self):
+        """
+        Returns True if the connection is still usable.
+        """
+        if self.__typeProtocol == 'ftp':
+            try:
+                self.__t.voidcmd('NOOP')
+            except all_errors:
+                return False
+            return True
+        elif self.__typeProtocol == 'sftp':
+            return self.__ssh.is_active()
+
+    def __close(self):
+        """
+        Closes the connection, ignoring errors from connections already dropped by the server.
+        """
+        if self.__typeProtocol == 'ftp':
+            try:
+                self.__t.quit()
+            except all_errors:
+                self.__t.close()
+        elif self.__typeProtocol == 'sftp':
+            if self.__t is not None:
+                self.__t.close()
+            self.__ssh.close()
+
     def disconnect(self):
         """
         This method disconnects the current connection.
+        Pooled connections stay open for the next fromPool call and are closed by closePool.
         """
+        if self.__pooled:
+            return
         if self.__typeProtocol == 'ftp':
             self.__t.quit()       
         elif self.__typeProtocol == 'sftp':
@@ -168,15 +341,11 @@ class PyFileTransfer(object):
         """
         Returns separate paths  to string.
         """  
-        if len(paths)== 0:
+        if not paths:
             return None
-        if len(paths)== 1:
-            return paths[0]
-        else:
-            path = paths[0]        
-        for i in paths[1:]:
-            path += self.__SEP + i          
-        return path  
+        return self.__SEP.join(paths)
+
+atexit.register(PyFileTransfer.closePool)
        
                          
 if __name__ == '__main__':
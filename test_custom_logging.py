@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+import custom_logging
+from custom_logging import BufferedFileHandler, LoggerFactory, StaticLoggerFactory, set_logger
+
+
+class ListHandler(logging.Handler):
+
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+class GateHandler(logging.Handler):
+    """
+    Holds the shared listener until the gate is opened
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.gate = threading.Event()
+        self.opened = False
+
+    def emit(self, record):
+        self.opened = self.gate.wait(5)
+
+
+class BufferedFileHandlerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.log_dir = tempfile.mkdtemp()
+        self.log_file = os.path.join(self.log_dir, 'test.log')
+
+    def tearDown(self):
+        shutil.rmtree(self.log_dir)
+
+    def emit(self, handler, count, level=logging.INFO):
+        for i in range(count):
+            handler.handle(logging.LogRecord('test', level, __file__, 0, 'message %d', (i,), None))
+
+    def test_nothing_written_before_flush(self):
+        handler = BufferedFileHandler(self.log_file, max_bytes=64 * 1024 * 1024, encoding='utf-8')
+        self.addCleanup(handler.close)
+        self.emit(handler, 100)
+        self.assertEqual(os.path.getsize(self.log_file), 0)
+        handler.flush()
+        self.assertEqual(os.path.getsize(self.log_file), sum(len('message %d\n' % i) for i in range(100)))
+
+    def test_error_is_flushed(self):
+        handler = BufferedFileHandler(self.log_file, encoding='utf-8')
+        self.addCleanup(handler.close)
+        self.emit(handler, 1, logging.ERROR)
+        self.assertEqual(os.path.getsize(self.log_file), len('message 0\n'))
+
+    def test_rotates_at_max_bytes(self):
+        handler = BufferedFileHandler(self.log_file, max_bytes=100, backup_count=2, encoding='utf-8')
+        self.addCleanup(handler.close)
+        self.emit(handler, 30)
+        handler.flush()
+        self.assertTrue(os.path.exists(self.log_file + '.1'))
+        for name in os.listdir(self.log_dir):
+            self.assertLess(os.path.getsize(os.path.join(self.log_dir, name)), 100)
+
+    def test_no_rotation_without_backups(self):
+        handler = BufferedFileHandler(self.log_file, max_bytes=100, encoding='utf-8')
+        self.addCleanup(handler.close)
+        stream = handler.stream
+        self.emit(handler, 30)
+        self.assertIs(handler.stream, stream)
+        handler.flush()
+        self.assertEqual(os.listdir(self.log_dir), ['test.log'])
+
+
+class SetLoggerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.log_dir = tempfile.mkdtemp()
+        custom_logging._STDOUT_HANDLER.setLevel(logging.CRITICAL)
+
+    def tearDown(self):
+        custom_logging._STDOUT_HANDLER.setLevel(logging.DEBUG)
+        shutil.rmtree(self.log_dir)
+
+    def test_loggers_share_rotating_file(self):
+        loggers = [set_logger('shared %d' % i, self.log_dir, max_bytes=2000, backup_count=100) for i in range(2)]
+        for i in range(200):
+            for logger in loggers:
+                logger.info('line %d', i)
+        loggers[1].handlers[0].wait_handled()
+        file_handler = loggers[0].handlers[0].targets[1]
+        self.assertIs(file_handler, loggers[1].handlers[0].targets[1])
+        file_handler.close()
+        lines = 0
+        for name in os.listdir(self.log_dir):
+            with open(os.path.join(self.log_dir, name), encoding='utf-8') as log:
+                lines += len(log.readlines())
+        self.assertEqual(lines, 400)
+
+
+class LoggerFactoryTest(unittest.TestCase):
+
+    def setUp(self):
+        self.log_dir = tempfile.mkdtemp()
+        custom_logging._STDOUT_HANDLER.setLevel(logging.CRITICAL)
+
+    def tearDown(self):
+        custom_logging._STDOUT_HANDLER.setLevel(logging.DEBUG)
+        shutil.rmtree(self.log_dir)
+
+    def read_lines(self):
+        lines = []
+        for name in os.listdir(self.log_dir):
+            with open(os.path.join(self.log_dir, name), encoding='utf-8') as log:
+                lines += log.readlines()
+        return lines
+
+    def test_instances_share_rotating_file(self):
+        loggers = [LoggerFactory('app', self.log_dir, max_bytes=2000, backup_count=100) for _ in range(2)]
+        self.assertIs(loggers[0].file_handler, loggers[1].file_handler)
+        for i in range(200):
+            for logger in loggers:
+                logger.info('line %d', i)
+        loggers[0].close()
+        # the file stays open for the other logger
+        loggers[1].info('after close')
+        loggers[1].close()
+        for name in os.listdir(self.log_dir):
+            self.assertLess(os.path.getsize(os.path.join(self.log_dir, name)), 2000)
+        self.assertEqual(len(self.read_lines()), 401)
+
+    def test_toggles_keep_queued_records(self):
+        logger = LoggerFactory('routing')
+        self.addCleanup(logger.close)
+        logger.disable_console_output()
+        console = logger.stdout_handler = ListHandler()
+        logger.enable_console_output()
+        # hold the listener so the records below stay queued while the output is toggled
+        gate = GateHandler()
+        blocker = custom_logging._RoutingQueueHandler(gate)
+        blocker.handle(logging.LogRecord('gate', logging.INFO, __file__, 0, 'gate', (), None))
+        logger.info('before')
+        logger.disable_console_output()
+        logger.info('hidden')
+        logger.enable_console_output()
+        logger.info('after')
+        gate.gate.set()
+        logger.queue_handler.wait_handled()
+        self.assertTrue(gate.opened)
+        self.assertEqual(console.messages, ['before', 'after'])
+
+    def test_close_is_idempotent(self):
+        logger = LoggerFactory('closing', self.log_dir)
+        logger.info('line')
+        logger.close()
+        logger.close()
+        self.assertTrue(logger.disabled)
+        self.assertFalse(logger.has_console_handler())
+        self.assertFalse(logger.has_file_handler())
+        logger.enable_console_output()
+        logger.enable_file_output()
+        self.assertTrue(logger.disabled)
+        self.assertEqual(logger.handlers, [])
+        self.assertEqual(len(self.read_lines()), 1)
+
+    def test_added_handler_keeps_logger_enabled(self):
+        logger = LoggerFactory('fast path')
+        self.addCleanup(logger.close)
+        added = ListHandler()
+        logger.addHandler(added)
+        logger.disable_console_output()
+        self.assertFalse(logger.disabled)
+        logger.info('kept')
+        self.assertEqual(added.messages, ['kept'])
+        logger.removeHandler(added)
+        self.assertTrue(logger.disabled)
+        logger.enable_console_output()
+        self.assertFalse(logger.disabled)
+
+
+class StaticLoggerFactoryTest(unittest.TestCase):
+
+    def test_one_logger_per_name(self):
+        logger = StaticLoggerFactory('static')
+        self.assertIs(StaticLoggerFactory('static'), logger)
+        self.assertEqual(len(logger.handlers), 1)
+
+    def test_keeps_existing_handlers(self):
+        logger = set_logger('static existing')
+        self.assertIs(StaticLoggerFactory('static existing'), logger)
+        self.assertEqual(len(logger.handlers), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()